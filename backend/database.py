@@ -7,10 +7,120 @@ import pickle
 import uuid
 import os
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple
 import numpy as np
 import sys
 import json
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+
+# Optional: orjson serializes and parses JSON (the analysis column, the demo
+# data files) faster than the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Parse JSON from str or bytes with orjson when it's installed
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Embedding BLOBs start with a one-byte format tag. New rows use int8: a
+# float32 per-vector scale followed by int8 values (v ~= scale * q), a
+# quarter of the float32 size with negligible effect on cosine ranking for
+# MiniLM-class embeddings. Rows from the previous format are raw float16
+# values; rows written before that are pickles, which always start with the
+# protocol opcode 0x80.
+_EMBEDDING_FP16 = b"\x01"
+_EMBEDDING_INT8 = b"\x02"
+
+
+def _encode_embedding(embedding: np.ndarray) -> bytes:
+    """Serialize an embedding to the tagged int8 BLOB format."""
+    vector = np.asarray(embedding, dtype=np.float32).ravel()
+    peak = float(np.abs(vector).max()) if vector.size else 0.0
+    scale = np.float32(peak / 127) if peak else np.float32(1)
+    quantized = np.round(vector / scale).astype(np.int8)
+    return _EMBEDDING_INT8 + scale.tobytes() + quantized.tobytes()
+
+
+def _decode_embedding(blob: bytes) -> np.ndarray:
+    """Deserialize an embedding BLOB to float32, accepting older formats."""
+    tag = blob[:1]
+    if tag == _EMBEDDING_INT8:
+        scale = np.frombuffer(blob, dtype=np.float32, count=1, offset=1)[0]
+        return np.frombuffer(blob, dtype=np.int8, offset=5).astype(np.float32) * scale
+    if tag == _EMBEDDING_FP16:
+        return np.frombuffer(blob, dtype=np.float16, offset=1).astype(np.float32)
+    return pickle.loads(blob)
+
+
+def _decode_embeddings(blobs: List[bytes]) -> List[np.ndarray]:
+    """
+    Deserialize many embedding BLOBs at once.
+
+    When every blob has the same tagged format and dimension, they are
+    joined and converted in one pass into a contiguous (N, D) float32 matrix
+    whose rows are returned; otherwise (legacy pickles, mixed formats or
+    models) each blob is decoded on its own.
+    """
+    if not blobs:
+        return []
+    tag, size = blobs[0][:1], len(blobs[0])
+    if tag not in (_EMBEDDING_INT8, _EMBEDDING_FP16) or not all(
+        blob[:1] == tag and len(blob) == size for blob in blobs
+    ):
+        return [_decode_embedding(blob) for blob in blobs]
+
+    joined = b"".join(blob[1:] for blob in blobs)
+    if tag == _EMBEDDING_INT8:
+        rows = np.frombuffer(
+            joined, dtype=[("scale", "<f4"), ("values", "i1", (size - 5,))]
+        )
+        matrix = rows["values"].astype(np.float32) * rows["scale"][:, None]
+    else:
+        matrix = np.frombuffer(joined, dtype=np.float16).astype(np.float32)
+    return list(matrix.reshape(len(blobs), -1))
+
+
+def _encode_analysis(analysis: Optional[dict]) -> Optional[str]:
+    """Serialize an analysis dict to compact JSON (None if empty)."""
+    # Use JSON instead of str() for proper serialization; the column is only
+    # read back as JSON, so skip separator spaces and \u escapes
+    if not analysis:
+        return None
+    if ORJSON_AVAILABLE:
+        try:
+            # orjson output is already compact UTF-8; it rejects a few types
+            # json accepts (e.g. non-str dict keys), which fall through below
+            return orjson.dumps(analysis, option=orjson.OPT_SERIALIZE_NUMPY).decode(
+                "utf-8"
+            )
+        except TypeError:
+            pass
+    return json.dumps(analysis, separators=(",", ":"), ensure_ascii=False)
+
+
+# Single-row INSERT for save_entry: one SQL string means sqlite3 compiles the
+# statement once and reuses it from its statement cache.
+_INSERT_ENTRY_SQL = """
+    INSERT INTO entries (id, timestamp, content, mood_rating, embedding, analysis)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Rows per multi-row INSERT in save_entries. Six parameters per row keeps
+# each statement under SQLite's historical 999 bound-parameter limit.
+_INSERT_ROWS_PER_STATEMENT = 150
+
+
+@lru_cache(maxsize=8)
+def _insert_entries_sql(row_count: int) -> str:
+    """INSERT with `row_count` VALUES tuples; cached so each size is built once."""
+    return (
+        "INSERT INTO entries (id, timestamp, content, mood_rating, embedding, analysis) VALUES "
+        + ",".join(["(?, ?, ?, ?, ?, ?)"] * row_count)
+    )
 
 
 class Database:
@@ -31,6 +141,16 @@ class Database:
         # Connect to SQLite
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
 
+        # WAL appends commits to a log instead of rewriting pages through a
+        # rollback journal, and readers don't block the writer. Durability
+        # stays at the default; bulk_load() relaxes it for large writes.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+
+        # Keep temporary b-trees (index rebuilds, sorts) in memory and give
+        # the page cache ~20 MB, so a bulk load's working set stays in RAM
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")
+
         # Create tables if they don't exist
         self.create_tables()
 
@@ -59,6 +179,28 @@ class Database:
         """
         )
 
+        # Entry embeddings keyed by content hash (see Analyzer.embedding_cache_key)
+        # so the analyzer can skip re-encoding text it has already seen
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                content_hash TEXT PRIMARY KEY,
+                embedding BLOB NOT NULL
+            )
+        """
+        )
+
+        # Small key/value store for bookkeeping such as which demo data set
+        # is loaded; a primary-key lookup instead of scanning entries
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """
+        )
+
         self.conn.commit()
         print("✅ Database tables created", flush=True)
 
@@ -68,38 +210,144 @@ class Database:
         mood_rating: int,
         embedding: np.ndarray = None,
         analysis: dict = None,
+        timestamp: str = None,
     ) -> str:
-        """Save a journal entry."""
-        entry_id = str(uuid.uuid4())
-        timestamp = datetime.now().isoformat()
+        """Save a journal entry. `timestamp` defaults to now (ISO format)."""
+        row = self._entry_row(content, mood_rating, embedding, analysis, timestamp)
+        entry_id = row[0]
+
+        self.conn.execute(_INSERT_ENTRY_SQL, row)
+        self.conn.commit()
+
+        print(f"✅ Saved entry: {entry_id[:8]}... (mood: {mood_rating})", flush=True)
+        return entry_id
+
+    def _entry_row(
+        self,
+        content: str,
+        mood_rating: int,
+        embedding: Optional[np.ndarray],
+        analysis: Optional[dict],
+        timestamp: Optional[str],
+    ) -> Tuple:
+        """Build the parameter tuple for _INSERT_ENTRY_SQL with a new entry id."""
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
 
         # Convert NumPy array to bytes for SQLite storage
-        embedding_blob = pickle.dumps(embedding) if embedding is not None else None
+        embedding_blob = (
+            _encode_embedding(embedding) if embedding is not None else None
+        )
 
-        # Use JSON instead of str() for proper serialization
-        analysis_json = json.dumps(analysis) if analysis else None
+        analysis_json = _encode_analysis(analysis)
 
-        self.conn.execute(
-            """
-            INSERT INTO entries (id, timestamp, content, mood_rating, embedding, analysis)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            (entry_id, timestamp, content, mood_rating, embedding_blob, analysis_json),
+        return (
+            str(uuid.uuid4()),
+            timestamp,
+            content,
+            mood_rating,
+            embedding_blob,
+            analysis_json,
         )
 
-        self.conn.commit()
+    def save_entries(
+        self, entries: Iterable[Dict], replace: bool = False
+    ) -> List[str]:
+        """
+        Save many journal entries in a single transaction.
+
+        `entries` is any iterable (a generator works) of dicts with the
+        `save_entry` keyword arguments (content, mood_rating, and optionally
+        embedding, analysis, timestamp).
+        Rows go in as multi-row INSERTs of up to 150 entries and one commit,
+        instead of a statement and commit per entry. With `replace=True` existing entries are deleted
+        in the same transaction, so a failure leaves the old journal intact,
+        and the table's indexes are rebuilt once after the insert.
+        """
+        entry_ids = []
+
+        # Rows are encoded one chunk at a time as they are inserted, so a
+        # large load never holds every serialized row in memory at once
+        def rows():
+            for entry in entries:
+                row = self._entry_row(
+                    entry["content"],
+                    entry["mood_rating"],
+                    entry.get("embedding"),
+                    entry.get("analysis"),
+                    entry.get("timestamp"),
+                )
+                entry_ids.append(row[0])
+                yield row
+
+        # BEGIN IMMEDIATE takes the write lock up front; the context manager
+        # commits on success and rolls everything back on error
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            if replace:
+                # Rebuilding the table from scratch: drop its indexes and
+                # recreate them once after the load instead of updating
+                # each B-tree per row. DDL is transactional in SQLite, so a
+                # failure restores the indexes along with the old rows.
+                indexes = self.conn.execute(
+                    """
+                    SELECT name, sql FROM sqlite_master
+                    WHERE type = 'index' AND tbl_name = 'entries' AND sql IS NOT NULL
+                """
+                ).fetchall()
+                for name, _ in indexes:
+                    self.conn.execute(f'DROP INDEX "{name}"')
+                self.conn.execute("DELETE FROM entries")
+                self._insert_rows(rows())
+                for _, sql in indexes:
+                    self.conn.execute(sql)
+            else:
+                self._insert_rows(rows())
+
+        print(f"✅ Saved {len(entry_ids)} entries", flush=True)
+        return entry_ids
+
+    def _insert_rows(self, rows: Iterable[Tuple]):
+        """
+        Insert entry rows with multi-row VALUES statements.
 
-        print(f"✅ Saved entry: {entry_id[:8]}... (mood: {mood_rating})", flush=True)
-        return entry_id
+        One statement per chunk of _INSERT_ROWS_PER_STATEMENT rows is a
+        single VDBE program run, instead of re-binding and re-stepping a
+        one-row statement for every entry.
+        """
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, _INSERT_ROWS_PER_STATEMENT))
+            if not chunk:
+                break
+            self.conn.execute(
+                _insert_entries_sql(len(chunk)),
+                [value for row in chunk for value in row],
+            )
+
+    @contextmanager
+    def bulk_load(self):
+        """
+        Relax durability for a bulk write on this connection.
+
+        synchronous=NORMAL skips the fsync on each commit (in WAL mode the
+        log is only synced at checkpoints); the previous setting is restored
+        on exit so later writes keep the app's durability.
+        """
+        previous = self.conn.execute("PRAGMA synchronous").fetchone()[0]
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            yield self
+        finally:
+            self.conn.execute(f"PRAGMA synchronous={int(previous)}")
 
     def update_embedding(
         self, entry_id: str, embedding: np.ndarray, analysis: dict = None
     ):
         """Update an entry with its embedding after ML analysis."""
-        embedding_blob = pickle.dumps(embedding)
+        embedding_blob = _encode_embedding(embedding)
 
-        # Use JSON instead of str() for proper serialization
-        analysis_json = json.dumps(analysis) if analysis else None
+        analysis_json = _encode_analysis(analysis)
 
         self.conn.execute(
             """
@@ -136,23 +384,80 @@ class Database:
         """
         )
 
-        entries = []
-        for row in cursor:
-            # Unpickle bytes back to NumPy array
-            embedding = pickle.loads(row[1])
-
-            entries.append(
-                {
-                    "text": row[0],
-                    "embedding": embedding,
-                    "timestamp": row[2],
-                    "mood": row[3],
-                }
-            )
+        rows = cursor.fetchall()
+
+        # Decode bytes back to float32 NumPy arrays, all rows in one pass
+        embeddings = _decode_embeddings([row[1] for row in rows])
+
+        entries = [
+            {
+                "text": row[0],
+                "embedding": embedding,
+                "timestamp": row[2],
+                "mood": row[3],
+            }
+            for row, embedding in zip(rows, embeddings)
+        ]
 
         print(f"📦 Retrieved {len(entries)} entries for analysis", flush=True)
         return entries
 
+    def get_cached_embeddings(self, limit: int = 512) -> List[Tuple[str, np.ndarray]]:
+        """Get the most recently cached (content_hash, embedding) pairs, oldest first."""
+        cursor = self.conn.execute(
+            """
+            SELECT content_hash, embedding
+            FROM embedding_cache
+            ORDER BY rowid DESC
+            LIMIT ?
+        """,
+            (limit,),
+        )
+
+        rows = cursor.fetchall()
+        rows.reverse()
+        embeddings = _decode_embeddings([row[1] for row in rows])
+        return [(row[0], embedding) for row, embedding in zip(rows, embeddings)]
+
+    def cache_embedding(self, content_hash: str, embedding: np.ndarray):
+        """Store an entry embedding under its content hash."""
+        self.conn.execute(
+            """
+            INSERT OR REPLACE INTO embedding_cache (content_hash, embedding)
+            VALUES (?, ?)
+        """,
+            (content_hash, _encode_embedding(embedding)),
+        )
+        self.conn.commit()
+
+    def cache_embeddings(self, pairs: Iterable[Tuple[str, np.ndarray]]):
+        """Store many (content_hash, embedding) pairs in one transaction."""
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO embedding_cache (content_hash, embedding)
+                VALUES (?, ?)
+            """,
+                ((key, _encode_embedding(embedding)) for key, embedding in pairs),
+            )
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Return the stored value for `key`, or None if it isn't set."""
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: Optional[str]):
+        """Store `value` under `key`; None removes the key."""
+        if value is None:
+            self.conn.execute("DELETE FROM meta WHERE key = ?", (key,))
+        else:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+        self.conn.commit()
+
     def get_recent_entries(self, limit: int = 20) -> List[Dict]:
         """Get recent entries for display (with summaries extracted from analysis)."""
         cursor = self.conn.execute(
@@ -177,7 +482,7 @@ class Database:
             # Parse JSON analysis (works for new entries, skips old ones)
             if row[4]:
                 try:
-                    analysis = json.loads(row[4])
+                    analysis = json_loads(row[4])
                     if isinstance(analysis, dict) and "summary" in analysis:
                         entry["summary"] = analysis["summary"]
                         sys.stderr.write(
@@ -197,6 +502,10 @@ class Database:
         sys.stderr.flush()
         return entries
 
+    def count_entries(self) -> int:
+        """Count journal entries without computing the mood aggregates."""
+        return self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
     def get_stats(self) -> Dict:
         """Get aggregate statistics for dashboard."""
         cursor = self.conn.execute(
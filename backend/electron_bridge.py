@@ -16,8 +16,13 @@ User writes entry → Electron IPC → This script → Database + ML → Respons
 import sys
 import json
 import os
+from datetime import datetime
 from database import Database
-from ml.analyzer import Analyzer
+from log_config import configure_logging
+from ml.analyzer import get_analyzer
+
+# stdout is reserved for the JSON protocol, so logs go to stderr
+configure_logging()
 
 # Initialize database
 # Uses environment variable set by Electron, or falls back to local file
@@ -30,7 +35,14 @@ sys.stderr.flush()
 
 # Check if LLM mode is enabled (can be controlled via environment variable)
 use_llm = os.getenv("USE_LLM", "true").lower() == "true"
-analyzer = Analyzer(use_llm=use_llm)
+analyzer = get_analyzer(use_llm=use_llm)
+
+# Warm the embedding cache from previous sessions
+analyzer.warm_embedding_cache(db.get_cached_embeddings())
+
+# Load journal history into the analyzer once; new entries are appended
+# as they are saved instead of re-reading every embedding per request
+analyzer.register_entries(db.get_all_entries_for_analysis())
 
 sys.stderr.write("✅ ML analyzer ready\n")
 sys.stderr.flush()
@@ -72,10 +84,8 @@ def handle_create_entry(data, request_id):
         sys.stderr.write(f"📝 Processing entry (mood: {mood_rating}/5)...\n")
         sys.stderr.flush()
 
-        # Get past entries for ML comparison
-        past_entries = db.get_all_entries_for_analysis()
         sys.stderr.write(
-            f"📦 Retrieved {len(past_entries)} past entries for analysis\n"
+            f"📦 Comparing against {len(analyzer.past_entries)} past entries\n"
         )
         sys.stderr.flush()
 
@@ -83,7 +93,7 @@ def handle_create_entry(data, request_id):
         sys.stderr.write(f"🧠 Running ML analysis...\n")
         sys.stderr.flush()
 
-        analysis = analyzer.analyze_entry(content, past_entries, mood_rating)
+        analysis = analyzer.analyze_entry(content, mood_rating=mood_rating)
 
         sys.stderr.write(
             f"✅ ML analysis complete: {analysis['mood']['detected']} mood\n"
@@ -99,16 +109,24 @@ def handle_create_entry(data, request_id):
         }
 
         # Save entry with embedding and analysis
+        timestamp = datetime.now().isoformat()
         entry_id = db.save_entry(
             content=content,
             mood_rating=mood_rating,
             embedding=analysis["embedding"],
             analysis=analysis_for_db,  # Now JSON-serializable!
+            timestamp=timestamp,
         )
 
+        # Keep the analyzer's history in step with the database
+        analyzer.add_entry(content, analysis["embedding"], timestamp, mood_rating)
+
         sys.stderr.write(f"✅ Entry saved: {entry_id}\n")
         sys.stderr.flush()
 
+        # Persist the embedding so identical text skips the model next session
+        db.cache_embedding(analyzer.embedding_cache_key(content), analysis["embedding"])
+
         # Format response for Electron (include everything)
         response = {
             "entry_id": entry_id,
@@ -0,0 +1,22 @@
+"""
+Logging setup shared by the backend entry points.
+"""
+
+import logging
+import os
+import sys
+
+
+def configure_logging():
+    """
+    Send log records to stderr as bare messages.
+
+    Library modules log through `logging`; stdout is left to the caller
+    (the Electron bridge reserves it for the JSON protocol). LOG_LEVEL=DEBUG
+    shows per-entry analysis progress.
+    """
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=os.getenv("LOG_LEVEL", "INFO").upper(),
+        format="%(message)s",
+    )
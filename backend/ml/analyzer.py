@@ -3,15 +3,19 @@ ML Analyzer for Introspect - Multi-Factor Pattern Recognition & Composite Mental
 Enhanced with RAG LLM Pipeline for Natural Language Insights
 """
 
-import sys
+import logging
 import re
+import heapq
+import hashlib
 import os
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import List, Dict, Tuple, Optional
+from typing import Iterable, List, Dict, Tuple, Optional
 from datetime import datetime
-from collections import Counter, defaultdict
+from pathlib import Path
+from collections import Counter, OrderedDict, defaultdict, deque
+from functools import lru_cache
 
 # NEW: LLM inference for RAG pipeline
 try:
@@ -19,7 +23,591 @@ try:
     LLAMA_AVAILABLE = True
 except ImportError:
     LLAMA_AVAILABLE = False
-    sys.stderr.write("⚠️  llama-cpp-python not available. Using template-based insights.\n")
+
+logger = logging.getLogger(__name__)
+
+if not LLAMA_AVAILABLE:
+    logger.warning("⚠️  llama-cpp-python not available. Using template-based insights.")
+
+# Project root (the directory holding backend/). Electron passes the same
+# location as RESOURCES_PATH: the app resources when packaged, the repo
+# checkout in development.
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# GGUF weights for LLM insights, relative to RESOURCES_PATH. Fetched by
+# backend/scripts/download_gguf_model.py.
+GGUF_MODEL_PATH = Path("backend", "scripts", "models", "gemma-2-2b-it-Q4_K_M.gguf")
+
+# Name the download script saved the model under before it kept the Hugging
+# Face filename; still loaded so existing installs keep their LLM insights.
+LEGACY_GGUF_MODEL_PATH = GGUF_MODEL_PATH.with_name("gemma-2b-Q4_K_M.gguf")
+
+# Result keys Analyzer.analyze_entry can compute (besides "embedding").
+# Callers that need only some of them pass them as `features`.
+ANALYSIS_FEATURES = (
+    "insight",
+    "similar_entries",
+    "mood",
+    "mental_state",
+    "summary",
+    "writing_intensity",
+    "sentiment",
+    "reflection",
+)
+
+# Sentence embedding model used for similarity search and sentiment.
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# int8 dynamically quantized ONNX export shipped in the model repo. Its
+# MatMuls use VNNI int8 dot products on CPUs that have them.
+ONNX_QUANTIZED_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Static (model2vec) embedding model used when EMBEDDING_BACKEND=model2vec.
+MODEL2VEC_MODEL_NAME = "minishlab/potion-base-8M"
+
+# Token budget per entry for the embedding model. MiniLM attention is
+# quadratic in sequence length and most of an entry's emotional signal is in
+# its opening sentences, so long entries are truncated here.
+MAX_SEQ_LENGTH = 128
+
+# Entry embeddings kept in memory, keyed by content hash.
+EMBEDDING_CACHE_SIZE = 512
+
+# From this many texts to encode at once, tokenization and inference are
+# spread over a multi-process pool; below it process start-up dominates.
+# Only the torch backend on CPU uses the pool: ONNX Runtime sessions can't be
+# handed to spawned workers, and the pool would move a CUDA model to the CPU.
+MULTI_PROCESS_ENCODE_MIN = 256
+
+# LLM insights kept in memory: exact repeats are keyed by a hash of the full
+# prompt; near-duplicate entries (same mood rating, cosine similarity above
+# the threshold) reuse the insight of a recent entry, but only if it was built
+# from the same retrieved entries and history size.
+INSIGHT_CACHE_SIZE = 128
+SEMANTIC_INSIGHT_CACHE_SIZE = 64
+SEMANTIC_INSIGHT_THRESHOLD = 0.95
+
+# Reference phrases for nuanced sentiment. Embedded once per Analyzer.
+_EMOTION_REFS = {
+    "hopeful": [
+        "feeling hopeful",
+        "things might improve",
+        "I'm optimistic",
+        "looking forward",
+    ],
+    "defeated": ["giving up", "nothing works", "hopeless", "can't do this"],
+    "anxious": ["worried", "nervous", "anxious", "scared", "afraid"],
+    "calm": ["peaceful", "calm", "relaxed", "at ease", "tranquil"],
+    "energized": ["motivated", "energized", "excited", "driven", "inspired"],
+    "exhausted": ["tired", "drained", "exhausted", "burnt out", "depleted"],
+    "grateful": ["thankful", "grateful", "blessed", "appreciate", "fortunate"],
+    "angry": ["frustrated", "angry", "irritated", "furious", "mad"],
+    "sad": ["sad", "depressed", "down", "unhappy", "miserable"],
+    "content": ["content", "satisfied", "okay", "fine", "stable"],
+}
+
+# Keyword tables for timeline summary labels. Matching is plain substring
+# search, so "stressed" counts for "stress".
+_THEME_CATEGORIES = {
+    "work": (
+        "work",
+        "job",
+        "career",
+        "presentation",
+        "meeting",
+        "boss",
+        "manager",
+        "colleague",
+        "deadline",
+        "project",
+        "interview",
+        "promotion",
+        "performance",
+        "client",
+        "review",
+    ),
+    "relationships": (
+        "relationship",
+        "partner",
+        "friend",
+        "family",
+        "conflict",
+        "communication",
+        "connection",
+        "love",
+        "breakup",
+        "argument",
+        "lonely",
+        "social",
+        "dating",
+        "marriage",
+        "divorce",
+    ),
+    "mental_health": (
+        "anxiety",
+        "depression",
+        "therapy",
+        "therapist",
+        "medication",
+        "panic",
+        "stress",
+        "overwhelmed",
+        "burnout",
+        "worried",
+        "nervous",
+        "fear",
+        "anxious",
+        "scared",
+    ),
+    "physical_health": (
+        "health",
+        "sleep",
+        "exercise",
+        "gym",
+        "diet",
+        "tired",
+        "energy",
+        "pain",
+        "doctor",
+        "sick",
+        "headache",
+        "medical",
+    ),
+    "personal_growth": (
+        "growth",
+        "learning",
+        "confidence",
+        "success",
+        "achievement",
+        "progress",
+        "goal",
+        "improve",
+        "proud",
+        "accomplished",
+        "development",
+        "skills",
+    ),
+    "daily_life": (
+        "routine",
+        "habits",
+        "schedule",
+        "home",
+        "chores",
+        "errands",
+        "weekend",
+        "morning",
+        "evening",
+        "daily",
+    ),
+}
+
+# Title subjects in priority order: the first keyword present wins.
+_SPECIFIC_KEYWORDS = {
+    "performance review": "Performance Review",
+    "quarterly review": "Review",
+    "presentation": "Presentation",
+    "interview": "Interview",
+    "therapy": "Therapy Session",
+    "conflict": "Conflict",
+    "meeting": "Meeting",
+    "deadline": "Deadline",
+    "project": "Project",
+}
+
+# Capitalized words that are never a useful title subject.
+_EXCLUDE_WORDS = frozenset(
+    {
+        "I",
+        "The",
+        "A",
+        "And",
+        "But",
+        "So",
+        "Or",
+        "My",
+        "This",
+        "That",
+        "These",
+        "Those",
+        "It",
+        "They",
+        "We",
+        "He",
+        "She",
+        "Had",
+        "Was",
+        "Were",
+        "Been",
+        "Have",
+        "Has",
+        "Did",
+        "Do",
+    }
+)
+
+# First capitalized word of three or more letters that is not an excluded
+# word: the exclusions are folded in as a negative lookahead, so a single
+# search() finds the title subject without splitting or stripping.
+_PROPER_NOUN_PATTERN = re.compile(
+    r"\b(?!(?:"
+    + "|".join(re.escape(w) for w in sorted(_EXCLUDE_WORDS))
+    + r")\b)[A-Z][A-Za-z]{2,}\b"
+)
+
+# Every theme and title keyword, compiled once into a single lookahead
+# alternation so one findall scans the text a single time. Alternatives are
+# ordered longest first; any keywords matching at the same position are
+# prefixes of the longest one, so _KEYWORD_PREFIXES expands each reported
+# match back to all of them. The result is the same set of keywords that
+# separate `keyword in text` checks would find.
+_ALL_KEYWORDS = sorted(
+    {kw for keywords in _THEME_CATEGORIES.values() for kw in keywords}
+    | set(_SPECIFIC_KEYWORDS),
+    key=len,
+    reverse=True,
+)
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in _ALL_KEYWORDS) + "))"
+)
+_KEYWORD_PREFIXES = {
+    kw: frozenset(other for other in _ALL_KEYWORDS if kw.startswith(other))
+    for kw in _ALL_KEYWORDS
+}
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize each row so cosine similarity reduces to a dot product.
+
+    The row norms come from one einsum over the whole (N, D) matrix, so the
+    model's output is normalized in a single vectorized pass.
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))[:, None]
+    return matrix / np.maximum(norms, np.float32(1e-12))
+
+
+# Reflective vs. venting markers for _analyze_reflection_depth.
+_REFLECTIVE_PHRASES = (
+    "i wonder",
+    "i realize",
+    "i realized",
+    "i noticed",
+    "i learned",
+    "maybe",
+    "perhaps",
+    "what if",
+    "i think",
+    "i believe",
+    "i understand",
+    "i see now",
+    "looking back",
+)
+_VENTING_PHRASES = (
+    "i hate",
+    "i can't",
+    "i cant",
+    "nothing",
+    "never works",
+    "always",
+    "why does",
+    "why do",
+    "sick of",
+    "so tired of",
+)
+
+# Simplified theme detection run over every past entry in
+# _analyze_theme_cooccurrence.
+_COOCCURRENCE_THEME_KEYWORDS = {
+    "work": ("work", "job", "meeting", "deadline", "project"),
+    "sleep": ("sleep", "tired", "exhausted", "insomnia"),
+    "anxiety": ("anxiety", "anxious", "worried", "stress"),
+    "relationships": ("relationship", "partner", "friend", "family"),
+    "exercise": ("exercise", "gym", "workout", "run"),
+    "mental_health": ("therapy", "depression", "mental"),
+}
+
+# Common phrases that never count as a user's personal phrasing.
+_GENERIC_PHRASES = frozenset(
+    {
+        "i feel",
+        "i am",
+        "i was",
+        "i have",
+        "i want",
+        "i think",
+        "i need",
+        "i can",
+        "i will",
+        "i would",
+        "i should",
+        "it is",
+        "it was",
+        "to be",
+        "in the",
+        "of the",
+        "and i",
+    }
+)
+
+# Coping actions ("talked to ...", "went for a ...") found in past entries.
+_ACTION_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in [
+        r"talked to (\w+)",
+        r"went for a (\w+)",
+        r"decided to ([\w\s]{3,20})",
+        r"started ([\w\s]{3,20})",
+        r"tried ([\w\s]{3,20})",
+        r"called (\w+)",
+        r"reached out to (\w+)",
+    ]
+)
+
+# Emotions the legacy _detect_sentiment reports as "positive".
+_POSITIVE_EMOTIONS = frozenset({"hopeful", "calm", "energized", "grateful", "content"})
+
+# Sentence scoring keywords for _meaningful_quote.
+_ACTION_KEYWORDS = (
+    "decided",
+    "tried",
+    "started",
+    "realized",
+    "learned",
+    "talked",
+    "called",
+    "went",
+    "made",
+    "chose",
+)
+_EMOTION_KEYWORDS = (
+    "feel",
+    "felt",
+    "feeling",
+    "emotion",
+    "mood",
+    "happy",
+    "sad",
+    "anxious",
+    "relieved",
+    "grateful",
+)
+
+# Instruction preamble for the RAG prompt. It is identical on every call and
+# placed before any entry-specific text, so llama.cpp keeps its evaluated
+# tokens between generations and only prefills what follows.
+_RAG_PROMPT_PREFIX = """You are a compassionate journaling companion helping someone process their emotions. You have access to their current journal entry and past similar entries.
+
+TASK:
+Analyze connections between the current entry and past entries. Identify:
+
+1. **Recurring Themes**: Topics, concerns, or situations that appear across entries
+2. **Behavioral Patterns**: Repeated actions, reactions, or coping mechanisms
+3. **Emotional Trajectories**: How feelings about similar situations have evolved
+4. **Cognitive Patterns**: Thought processes, decision-making styles, or mental frameworks
+5. **Progress Indicators**: Growth, stagnation, or regression in specific areas
+6. **Blind Spots**: Patterns the writer may not be aware of
+
+GUIDELINES:
+- Be specific, citing dates and examples
+- Note both positive patterns and areas for reflection
+- Avoid being judgmental; focus on observation
+- Highlight growth and positive changes
+- Ask thought-provoking questions when appropriate
+- Keep insights actionable
+
+Talk to the person Provide 3-5 key insights, prioritizing the most meaningful patterns. Do not make insights up if there are no past similar entries.
+
+Be conversational, empathetic, and specific to their experiences. Avoid generic advice.
+
+In the first paragraph, state all of the context you were given. In the second paragraph, tell the user the patterns you have found.
+"""
+
+
+def _days_ago_to_phrase(days_ago: int) -> str:
+    """Bucket a whole-day age into a human-readable 'time ago' phrase."""
+    if days_ago == 0:
+        return "earlier today"
+    elif days_ago == 1:
+        return "yesterday"
+    elif days_ago < 7:
+        return f"{days_ago} days ago"
+    elif days_ago < 30:
+        weeks = days_ago // 7
+        return f"{weeks} week{'s' if weeks > 1 else ''} ago"
+    elif days_ago < 365:
+        months = days_ago // 30
+        return f"{months} month{'s' if months > 1 else ''} ago"
+    else:
+        years = days_ago // 365
+        return f"{years} year{'s' if years > 1 else ''} ago"
+
+
+@lru_cache(maxsize=256)
+def _meaningful_quote(text: str) -> str:
+    """
+    Extract the most meaningful sentence(s) from a past entry.
+
+    The quote depends only on the text, and the same past entry is quoted
+    again whenever it is among the closest matches for a new entry, so the
+    result is memoized per text.
+    """
+    sentences = [s.strip() for s in text.split(".") if s.strip()]
+
+    if len(sentences) == 0:
+        return text[:200]
+
+    # Score sentences by meaningfulness
+    scored_sentences = []
+
+    for sent in sentences:
+        score = 0
+        sent_lower = sent.lower()
+        word_count = len(sent.split())
+
+        # Prioritize action sentences
+        if any(word in sent_lower for word in _ACTION_KEYWORDS):
+            score += 4
+
+        # Value emotional content
+        if any(word in sent_lower for word in _EMOTION_KEYWORDS):
+            score += 2
+
+        # Prefer substantial sentences (not too short, not too long)
+        if 8 <= word_count <= 20:
+            score += 2
+        elif word_count > 20:
+            score += 1
+
+        scored_sentences.append((score, sent))
+
+    # Take the best 1-2 sentences. nlargest selects them without sorting
+    # every sentence and keeps the same tie order as a stable sort.
+    top = heapq.nlargest(2, scored_sentences, key=lambda x: x[0])
+
+    if len(top) >= 2 and top[0][0] > 0:
+        quote = f"{top[0][1]}. {top[1][1]}."
+    else:
+        quote = top[0][1] + "."
+
+    # Truncate if too long
+    if len(quote) > 200:
+        quote = quote[:197] + "..."
+
+    return quote
+
+
+class PastEntries:
+    """
+    Past journal entries stored as a struct of arrays for fast retrieval.
+
+    Embeddings live in one preallocated, L2-normalized (N, D) float32 matrix
+    that grows by doubling, so similarity search is a single matrix-vector
+    product with no per-call stacking. Text, timestamp and mood are parallel
+    columns; timestamps are also kept as a datetime64 array, parsed once on
+    append, so date arithmetic never re-parses ISO strings. Indexing or
+    iterating yields the same dicts `Database.get_all_entries_for_analysis`
+    returns, so code written against the list-of-dicts format keeps working.
+
+    `dim` fixes the embedding width; `extend` skips rows of any other width,
+    e.g. entries embedded by a different EMBEDDING_BACKEND model.
+    """
+
+    def __init__(self, capacity: int = 64, dim: Optional[int] = None):
+        self._capacity = max(capacity, 1)
+        self.dim = dim
+        self._matrix: Optional[np.ndarray] = None
+        self._times = np.empty(self._capacity, dtype="datetime64[us]")
+        self._size = 0
+        self.texts: List[str] = []
+        self.timestamps: List[str] = []
+        self.moods: List[int] = []
+
+    @classmethod
+    def from_dicts(
+        cls, entries: List[Dict], dim: Optional[int] = None
+    ) -> "PastEntries":
+        """Build from the list-of-dicts format used by the database layer."""
+        past = cls(capacity=len(entries), dim=dim)
+        past.extend(entries)
+        return past
+
+    def append(self, text: str, embedding: np.ndarray, timestamp: str, mood: int = 3):
+        """Add one entry, normalizing its embedding into the shared matrix."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+
+        if self.dim is None:
+            self.dim = vector.shape[0]
+        if vector.shape[0] != self.dim:
+            raise ValueError(
+                f"Embedding has {vector.shape[0]} dimensions, expected {self.dim}"
+            )
+
+        if self._matrix is None:
+            self._matrix = np.empty((self._capacity, self.dim), dtype=np.float32)
+        elif self._size == self._matrix.shape[0]:
+            grown = np.empty(
+                (self._matrix.shape[0] * 2, self._matrix.shape[1]), dtype=np.float32
+            )
+            grown[: self._size] = self._matrix[: self._size]
+            self._matrix = grown
+            self._times = np.resize(self._times, grown.shape[0])
+
+        norm = np.linalg.norm(vector)
+        self._matrix[self._size] = vector / max(norm, 1e-12)
+        self._times[self._size] = np.datetime64(timestamp, "us")
+        self._size += 1
+
+        self.texts.append(text)
+        self.timestamps.append(timestamp)
+        self.moods.append(mood)
+
+    def extend(self, entries: Iterable[Dict]):
+        """Append entries given in the list-of-dicts format."""
+        skipped = 0
+        for entry in entries:
+            if self.dim is not None and np.size(entry["embedding"]) != self.dim:
+                skipped += 1
+                continue
+            self.append(
+                entry["text"], entry["embedding"], entry["timestamp"], entry.get("mood", 3)
+            )
+
+        if skipped:
+            logger.warning(
+                "⚠️  Skipped %d past entries embedded with a different model", skipped
+            )
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """View of the normalized (N, D) embedding matrix."""
+        if self._matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._matrix[: self._size]
+
+    @property
+    def times(self) -> np.ndarray:
+        """View of the parsed timestamps as datetime64[us]."""
+        return self._times[: self._size]
+
+    def days_ago(self, now: datetime) -> np.ndarray:
+        """Whole days elapsed between each entry and `now` (floored like timedelta.days)."""
+        return (np.datetime64(now, "us") - self.times) // np.timedelta64(1, "D")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, idx: int) -> Dict:
+        return {
+            "text": self.texts[idx],
+            "embedding": self.embeddings[idx],
+            "timestamp": self.timestamps[idx],
+            "mood": self.moods[idx],
+        }
+
+    def __iter__(self):
+        for idx in range(self._size):
+            yield self[idx]
 
 
 class Analyzer:
@@ -27,165 +615,326 @@ class Analyzer:
 
     def __init__(self, use_llm: bool = True):
         """Initialize the analyzer with ML model and optional LLM."""
-        sys.stderr.write("📦 Loading ML model...\n")
-        sys.stderr.flush()
+        logger.info("📦 Loading ML model...")
         
-        # Load embedding model (always needed for semantic search)
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
-        sys.stderr.write("✅ ML model loaded successfully\n")
-        sys.stderr.flush()
+        # This process only runs inference: give PyTorch every core for
+        # intra-op parallelism. Autograd is left alone process-wide; the
+        # analyzer's own encode calls run under torch.inference_mode().
+        torch.set_num_threads(os.cpu_count() or 4)
+
+        # Load embedding model (always needed for semantic search).
+        # EMBEDDING_BACKEND selects "onnx" (default), "torch" or "model2vec".
+        self.embedding_backend = os.getenv("EMBEDDING_BACKEND", "onnx").lower()
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.model = self._load_embedding_model()
+        self.model.max_seq_length = MAX_SEQ_LENGTH
+        self.model.eval()
+        self.embedding_dim = self.model.get_sentence_embedding_dimension()
+        logger.info(
+            "✅ ML model loaded successfully (%s backend on %s)",
+            self.embedding_backend,
+            self.device,
+        )
+
+        # Keep one handle on the tokenizer so every encode() shares it.
+        # The Rust-backed "fast" tokenizer is much cheaper per call than the
+        # pure-Python one, so warn loudly if we ended up without it.
+        # (model2vec uses a `tokenizers.Tokenizer` directly, always Rust)
+        self.tokenizer = self.model.tokenizer
+        if self.embedding_backend != "model2vec" and not getattr(
+            self.tokenizer, "is_fast", False
+        ):
+            logger.warning(
+                "⚠️  Fast tokenizer unavailable - install `tokenizers` for quicker encoding."
+            )
+
+        # Recently computed entry embeddings keyed by embedding_cache_key(),
+        # so resubmitting the same text skips the transformer entirely
+        self._embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+        # Generated LLM insights, see INSIGHT_CACHE_SIZE
+        self._insight_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._semantic_insights: deque = deque(maxlen=SEMANTIC_INSIGHT_CACHE_SIZE)
+
+        # Journal history kept in memory between calls (see register_entries),
+        # so long-running callers don't rebuild it for every analyzed entry
+        self.past_entries = PastEntries(dim=self.embedding_dim)
+
+        # Sentiment reference phrases never change, so embed them once here
+        # instead of re-encoding ~45 phrases on every analyzed entry. All
+        # phrases go through a single batched encode call and stay stacked in
+        # one (R, D) matrix, grouped by emotion; `_emotion_ref_offsets` marks
+        # where each emotion's rows start.
+        all_refs = [ref for refs in _EMOTION_REFS.values() for ref in refs]
+        with torch.inference_mode():
+            ref_embeddings = self.model.encode(all_refs, batch_size=64)
+        self._emotion_ref_matrix = _normalize_rows(ref_embeddings)
+        self._emotion_names = tuple(_EMOTION_REFS)
+        ref_counts = np.array([len(refs) for refs in _EMOTION_REFS.values()])
+        self._emotion_ref_counts = ref_counts.astype(np.float32)
+        self._emotion_ref_offsets = np.concatenate(([0], np.cumsum(ref_counts)[:-1]))
         
-        # Load LLM for insight generation (optional)
+        # LLM for insight generation (optional). The GGUF weights are loaded
+        # on first use by _ensure_llm_loaded, so embedding-only callers never
+        # pay for them.
         self.llm = None
         self.use_llm = use_llm and LLAMA_AVAILABLE
-        
-        if self.use_llm:
+
+        if not self.use_llm:
+            logger.info("📝 Using template-based insights (LLM disabled)")
+
+    def _ensure_llm_loaded(self):
+        """Load the GGUF model the first time an LLM insight is needed."""
+        if self.llm is not None or not self.use_llm:
+            return
+
+        try:
+            logger.info("🤖 Loading GGUF model for LLM insights...")
+            
+            # Get model path from environment or use default
+            resources = Path(os.getenv("RESOURCES_PATH", PROJECT_ROOT))
+            model_path = resources / GGUF_MODEL_PATH
+            if not model_path.exists() and (resources / LEGACY_GGUF_MODEL_PATH).exists():
+                model_path = resources / LEGACY_GGUF_MODEL_PATH
+                logger.info("📦 Using GGUF model saved under its old name: %s", model_path)
+
+            if not model_path.exists():
+                logger.warning(
+                    "⚠️  GGUF model not found at %s (or %s)",
+                    model_path,
+                    resources / LEGACY_GGUF_MODEL_PATH,
+                )
+                logger.warning(
+                    "⚠️  Run backend/scripts/download_gguf_model.py to enable LLM "
+                    "insights. Falling back to template-based insights."
+                )
+                self.use_llm = False
+            else:
+                self.llm = Llama(
+                    model_path=str(model_path),
+                    n_ctx=2048,  # Context window
+                    n_threads=os.cpu_count() or 4,  # CPU threads
+                    n_batch=512,  # Prompt tokens evaluated per batch
+                    n_gpu_layers=0,  # Use 0 for CPU-only, increase if GPU available
+                    verbose=False,
+                )
+                logger.info("✅ LLM loaded successfully (RAG mode enabled)")
+        except Exception as e:
+            logger.warning("⚠️  Failed to load LLM: %s", e)
+            logger.warning("⚠️  Falling back to template-based insights.")
+            self.llm = None
+            self.use_llm = False
+
+    def _load_embedding_model(self) -> SentenceTransformer:
+        """
+        Load the embedding model, preferring the ONNX Runtime backend.
+
+        ONNX Runtime fuses the transformer graph into optimized C++ kernels
+        and is several times faster than PyTorch for MiniLM on CPU. On CPU we
+        first try the int8 VNNI-quantized export, then the fp32 ONNX model.
+        It needs sentence-transformers >= 3.2 with the `onnx` extra; without
+        it we fall back to the PyTorch backend.
+
+        EMBEDDING_BACKEND=model2vec instead loads a static distilled model
+        (see MODEL2VEC_MODEL_NAME): token embeddings mean-pooled with no
+        transformer forward pass, far faster at a small quality cost. It
+        needs the `model2vec` package and produces embeddings of a different
+        size, so history embedded by MiniLM is left out of comparisons.
+        """
+        if self.embedding_backend == "model2vec":
             try:
-                sys.stderr.write("🤖 Loading GGUF model for LLM insights...\n")
-                sys.stderr.flush()
-                
-                # Get model path from environment or use default
-                resources_path = os.getenv("RESOURCES_PATH", os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                model_path = os.path.join(resources_path, "backend", "scripts", "models", "gemma-2b-Q4_K_M.gguf")
-                
-                if not os.path.exists(model_path):
-                    sys.stderr.write(f"⚠️  GGUF model not found at: {model_path}\n")
-                    sys.stderr.write("⚠️  Falling back to template-based insights.\n")
-                    sys.stderr.flush()
-                    self.use_llm = False
-                else:
-                    self.llm = Llama(
-                        model_path=model_path,
-                        n_ctx=2048,  # Context window
-                        n_threads=4,  # CPU threads
-                        n_gpu_layers=0,  # Use 0 for CPU-only, increase if GPU available
-                        verbose=False,
-                    )
-                    sys.stderr.write("✅ LLM loaded successfully (RAG mode enabled)\n")
-                    sys.stderr.flush()
+                from sentence_transformers.models import StaticEmbedding
+
+                static = StaticEmbedding.from_model2vec(MODEL2VEC_MODEL_NAME)
+                return SentenceTransformer(modules=[static], device=self.device)
             except Exception as e:
-                sys.stderr.write(f"⚠️  Failed to load LLM: {e}\n")
-                sys.stderr.write("⚠️  Falling back to template-based insights.\n")
-                sys.stderr.flush()
-                self.llm = None
-                self.use_llm = False
-        else:
-            sys.stderr.write("📝 Using template-based insights (LLM disabled)\n")
-            sys.stderr.flush()
+                logger.warning("⚠️  model2vec backend unavailable: %s", e)
+                logger.warning("⚠️  Falling back to ONNX embeddings.")
+                self.embedding_backend = "onnx"
+
+        if self.embedding_backend == "onnx" and self.device == "cpu":
+            try:
+                model = SentenceTransformer(
+                    EMBEDDING_MODEL_NAME,
+                    backend="onnx",
+                    device=self.device,
+                    model_kwargs={"file_name": ONNX_QUANTIZED_FILE},
+                )
+                # Quantized embeddings differ slightly from fp32 ones, so
+                # keep them apart in the embedding cache
+                self.embedding_backend = "onnx-qint8"
+                return model
+            except Exception as e:
+                logger.warning("⚠️  Quantized ONNX model unavailable: %s", e)
+
+        if self.embedding_backend == "onnx":
+            try:
+                return SentenceTransformer(
+                    EMBEDDING_MODEL_NAME, backend="onnx", device=self.device
+                )
+            except Exception as e:
+                logger.warning("⚠️  ONNX backend unavailable: %s", e)
+                logger.warning("⚠️  Falling back to PyTorch embeddings.")
+                self.embedding_backend = "torch"
+
+        return SentenceTransformer(EMBEDDING_MODEL_NAME, device=self.device)
 
     def analyze_entry(
-        self, new_entry_text: str, past_entries: List[Dict], mood_rating: int = 3
+        self,
+        new_entry_text: str,
+        past_entries: "Optional[List[Dict] | PastEntries]" = None,
+        mood_rating: int = 3,
+        new_embedding: Optional[np.ndarray] = None,
+        features: Optional[Iterable[str]] = None,
     ) -> Dict:
-        """Analyze a new journal entry with multi-factor composite scoring."""
-        sys.stderr.write(f"🧠 Analyzing entry: '{new_entry_text[:50]}...'\n")
-        sys.stderr.flush()
+        """
+        Analyze a new journal entry with multi-factor composite scoring.
+
+        `past_entries` may be the database's list of dicts or a `PastEntries`
+        store; callers analyzing several entries against the same history
+        should build the store once and pass it in. When omitted, the
+        analyzer's own history from `register_entries`/`add_entry` is used.
+        `new_embedding` may be a precomputed, L2-normalized embedding of
+        `new_entry_text`.
+
+        `features` limits the result to those keys of ANALYSIS_FEATURES
+        (plus "embedding", which is always returned); only the components
+        they depend on are computed. The default is the full analysis.
+        """
+        wanted = set(ANALYSIS_FEATURES if features is None else features)
+        need_insight = "insight" in wanted
+        need_mental_state = need_insight or bool(wanted & {"mood", "mental_state"})
+        need_sentiment = need_mental_state or bool(wanted & {"summary", "sentiment"})
+
+        if past_entries is None:
+            past_entries = self.past_entries
+        elif not isinstance(past_entries, PastEntries):
+            past_entries = PastEntries.from_dicts(past_entries, dim=self.embedding_dim)
+
+        # Read the wall clock once; every "days ago" computation below is
+        # relative to this instant
+        now = datetime.now()
+
+        # Per-entry progress is logged at DEBUG with lazy %-formatting, so in
+        # normal runs none of these messages are formatted or written
+        logger.debug("🧠 Analyzing entry: '%.50s...'", new_entry_text)
 
         # Generate embedding
-        new_embedding = self.model.encode(new_entry_text)
-        sys.stderr.write(f"✅ Generated embedding (shape: {new_embedding.shape})\n")
-        sys.stderr.flush()
+        if new_embedding is None:
+            new_embedding = self._encode([new_entry_text])[0]
+        logger.debug("✅ Generated embedding (shape: %s)", new_embedding.shape)
+        result = {"embedding": new_embedding}
 
         # Find similar entries
         similar_entries = []
-        if len(past_entries) > 0:
+        if not (need_insight or "similar_entries" in wanted):
+            logger.debug("⏭️  Similar-entry search not requested")
+        elif len(past_entries) > 0:
             similar_entries = self._find_similar_entries(
-                new_embedding, past_entries, top_k=5
+                new_embedding, past_entries, top_k=5, now=now
             )
-            sys.stderr.write(f"📊 Found {len(similar_entries)} similar entries\n")
-            sys.stderr.flush()
+            logger.debug("📊 Found %d similar entries", len(similar_entries))
         else:
-            sys.stderr.write("🔭 No past entries to compare (first entry!)\n")
-            sys.stderr.flush()
+            logger.debug("🔭 No past entries to compare (first entry!)")
 
         # MULTI-FACTOR ANALYSIS
 
         # 1. Writing intensity analysis
-        writing_intensity = self._analyze_writing_intensity(new_entry_text)
-        sys.stderr.write(
-            f"✍️  Writing intensity: {writing_intensity['intensity']} "
-            f"({writing_intensity['word_count']} words)\n"
-        )
-        sys.stderr.flush()
+        writing_intensity = None
+        if need_mental_state or "writing_intensity" in wanted:
+            writing_intensity = self._analyze_writing_intensity(new_entry_text)
+            logger.debug(
+                "✍️  Writing intensity: %s (%d words)",
+                writing_intensity["intensity"],
+                writing_intensity["word_count"],
+            )
 
         # 2. Nuanced sentiment detection
-        sentiment = self._detect_nuanced_sentiment(new_entry_text)
-        secondary_text = (
-            f" + {sentiment['secondary_emotion']}" if sentiment["is_mixed"] else ""
-        )
-        sys.stderr.write(
-            f"🎭 Emotional state: {sentiment['primary_emotion']}{secondary_text}\n"
-        )
-        sys.stderr.flush()
+        sentiment = None
+        if need_sentiment:
+            sentiment = self._detect_nuanced_sentiment(new_entry_text, new_embedding)
+            logger.debug(
+                "🎭 Emotional state: %s%s",
+                sentiment["primary_emotion"],
+                f" + {sentiment['secondary_emotion']}" if sentiment["is_mixed"] else "",
+            )
 
         # 3. Reflection depth analysis
-        reflection = self._analyze_reflection_depth(new_entry_text)
-        sys.stderr.write(
-            f"🤔 Processing mode: {reflection['mode']} "
-            f"({reflection['question_count']} questions asked)\n"
-        )
-        sys.stderr.flush()
+        reflection = None
+        if need_mental_state or "reflection" in wanted:
+            reflection = self._analyze_reflection_depth(new_entry_text)
+            logger.debug(
+                "🤔 Processing mode: %s (%d questions asked)",
+                reflection["mode"],
+                reflection["question_count"],
+            )
 
         # 4. Theme analysis (existing + co-occurrence)
-        summary = self._generate_summary_label(new_entry_text, mood_rating, sentiment)
+        summary = None
+        if need_insight or "summary" in wanted:
+            summary = self._generate_summary_label(
+                new_entry_text, mood_rating, sentiment
+            )
         theme_context = None
-        if len(past_entries) >= 3:
+        if need_insight and len(past_entries) >= 3:
             theme_context = self._analyze_theme_cooccurrence(
                 summary["themes"], past_entries
             )
             if theme_context:
-                sys.stderr.write(
-                    f"🔗 Theme pattern detected: {theme_context['combination']} "
-                    f"(appears {theme_context['frequency']}x)\n"
+                logger.debug(
+                    "🔗 Theme pattern detected: %s (appears %dx)",
+                    theme_context["combination"],
+                    theme_context["frequency"],
                 )
-                sys.stderr.flush()
 
         # 5. Writing frequency analysis
         frequency_pattern = None
-        if len(past_entries) >= 2:
-            frequency_pattern = self._analyze_writing_frequency(past_entries)
-            sys.stderr.write(f"📅 Writing pattern: {frequency_pattern['pattern']}\n")
-            sys.stderr.flush()
+        if need_insight and len(past_entries) >= 2:
+            frequency_pattern = self._analyze_writing_frequency(past_entries, now)
+            logger.debug("📅 Writing pattern: %s", frequency_pattern["pattern"])
 
         # 6. COMPOSITE MENTAL STATE SCORE
-        mental_state = self._calculate_mental_state_score(
-            mood_rating=mood_rating,
-            writing_intensity=writing_intensity,
-            sentiment=sentiment,
-            reflection=reflection,
-        )
-        sys.stderr.write(
-            f"🎯 Composite mental state: {mental_state['composite_score']}/5 "
-            f"(mood rating: {mood_rating}/5)\n"
-        )
-        sys.stderr.flush()
+        mental_state = None
+        mood = None
+        if need_mental_state:
+            mental_state = self._calculate_mental_state_score(
+                mood_rating=mood_rating,
+                writing_intensity=writing_intensity,
+                sentiment=sentiment,
+                reflection=reflection,
+            )
+            logger.debug(
+                "🎯 Composite mental state: %s/5 (mood rating: %s/5)",
+                mental_state["composite_score"],
+                mood_rating,
+            )
 
-        # Legacy mood field (kept for backwards compatibility)
-        mood = {
-            "detected": (
-                "positive" if mental_state["composite_score"] >= 3 else "negative"
-            ),
-            "confidence": mental_state["confidence"],
-        }
+            # Legacy mood field (kept for backwards compatibility)
+            mood = {
+                "detected": (
+                    "positive" if mental_state["composite_score"] >= 3 else "negative"
+                ),
+                "confidence": mental_state["confidence"],
+            }
 
         # Generate insight with all available signals
-        insight = self._generate_insight(
-            new_entry_text=new_entry_text,
-            similar_entries=similar_entries,
-            mood_rating=mood_rating,
-            mental_state=mental_state,
-            writing_intensity=writing_intensity,
-            sentiment=sentiment,
-            reflection=reflection,
-            theme_context=theme_context,
-            frequency_pattern=frequency_pattern,
-            all_past_entries=past_entries,
-        )
-        sys.stderr.write(f"💡 Generated multi-factor insight\n")
-        sys.stderr.flush()
+        if need_insight:
+            result["insight"] = self._generate_insight(
+                new_entry_text=new_entry_text,
+                similar_entries=similar_entries,
+                mood_rating=mood_rating,
+                mental_state=mental_state,
+                writing_intensity=writing_intensity,
+                sentiment=sentiment,
+                reflection=reflection,
+                theme_context=theme_context,
+                frequency_pattern=frequency_pattern,
+                all_past_entries=past_entries,
+                new_embedding=new_embedding,
+            )
+            logger.debug("💡 Generated multi-factor insight")
 
-        return {
-            "embedding": new_embedding,
-            "insight": insight,
+        components = {
             "similar_entries": similar_entries[:3],
             "mood": mood,  # Legacy field
             "mental_state": mental_state,  # NEW: Composite score
@@ -194,30 +943,211 @@ class Analyzer:
             "sentiment": sentiment,  # NEW
             "reflection": reflection,  # NEW
         }
+        result.update(
+            (key, value) for key, value in components.items() if key in wanted
+        )
+        return result
+
+    def register_entries(self, past_entries: List[Dict]):
+        """
+        Replace the analyzer's in-memory history.
+
+        Takes the list-of-dicts format from
+        `Database.get_all_entries_for_analysis`. Embeddings are normalized and
+        stacked once here; keep the history current with `add_entry` rather
+        than re-reading the database for every analysis.
+        """
+        self.past_entries = PastEntries.from_dicts(past_entries, dim=self.embedding_dim)
+
+    def add_entry(
+        self, text: str, embedding: np.ndarray, timestamp: str, mood: int = 3
+    ):
+        """Append one saved entry to the in-memory history."""
+        self.past_entries.append(text, embedding, timestamp, mood)
+
+    def analyze_batch(
+        self,
+        entries: List[Dict],
+        past_entries: "Optional[List[Dict] | PastEntries]" = None,
+        features: Optional[Iterable[str]] = None,
+        embeddings: Optional[np.ndarray] = None,
+    ) -> List[Dict]:
+        """
+        Analyze several new entries against the same history.
+
+        Args:
+            entries: [{"text": str, "mood": int}, ...]
+            past_entries: Same format as `analyze_entry` expects
+            features: Passed through to `analyze_entry`
+            embeddings: Precomputed L2-normalized embeddings, one row per
+                entry (e.g. from `embed_batch`); skips the encode step
+
+        Unless `embeddings` is given, all texts are embedded in one batched
+        encode call (sentence-transformers sorts the batch by length
+        internally to minimize padding), and the past entries are converted to
+        a `PastEntries` store once and shared.
+        Entries in the batch are not compared against each other.
+        """
+        if not entries:
+            return []
+
+        if embeddings is None:
+            logger.debug("🧠 Batch-encoding %d entries...", len(entries))
+            embeddings = self._encode([entry["text"] for entry in entries])
+
+        if past_entries is None:
+            past_entries = self.past_entries
+        elif not isinstance(past_entries, PastEntries):
+            past_entries = PastEntries.from_dicts(past_entries, dim=self.embedding_dim)
+
+        results = []
+        for entry, embedding in zip(entries, embeddings):
+            mood = entry.get("mood", 3)
+            results.append(
+                self.analyze_entry(
+                    entry["text"],
+                    past_entries,
+                    mood,
+                    new_embedding=embedding,
+                    features=features,
+                )
+            )
+        return results
+
+    # ============== EMBEDDING CACHE ==============
+
+    def embedding_cache_key(self, text: str) -> str:
+        """
+        Content hash identifying an entry's embedding.
+
+        Includes the model, backend and token budget so that changing any of
+        them never serves a stale vector.
+        """
+        key_source = (
+            f"{EMBEDDING_MODEL_NAME}|{self.embedding_backend}|{MAX_SEQ_LENGTH}|{text}"
+        )
+        return hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+
+    def warm_embedding_cache(self, cached: Iterable[Tuple[str, np.ndarray]]):
+        """
+        Seed the in-memory cache with (key, embedding) pairs, e.g. from SQLite.
+
+        Stored vectors are int8-quantized and come back slightly off unit
+        length, so each is re-normalized to match what `_encode` returns.
+        """
+        for key, embedding in cached:
+            self._remember_embedding(
+                key, _normalize_rows(np.reshape(embedding, (1, -1)))[0]
+            )
+
+    def _remember_embedding(self, key: str, embedding: np.ndarray):
+        """Insert into the LRU embedding cache, evicting the oldest entry."""
+        self._embedding_cache[key] = embedding
+        self._embedding_cache.move_to_end(key)
+        if len(self._embedding_cache) > EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+
+    def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed many texts in one batched model call.
+
+        Returns an (N, D) array of L2-normalized embeddings whose rows can be
+        passed to `analyze_entry` as `new_embedding`.
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._encode(texts)
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts as L2-normalized vectors, reusing cached embeddings.
+
+        Only cache misses reach the model, and they are encoded in a single
+        batched call.
+        """
+        keys = [self.embedding_cache_key(text) for text in texts]
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        missing = []
+        for i, key in enumerate(keys):
+            cached = self._embedding_cache.get(key)
+            if cached is None:
+                missing.append(i)
+            else:
+                self._embedding_cache.move_to_end(key)
+                embeddings[i] = cached
+
+        if missing:
+            to_encode = [texts[i] for i in missing]
+            if (
+                len(to_encode) >= MULTI_PROCESS_ENCODE_MIN
+                and self.embedding_backend == "torch"
+                and self.device == "cpu"
+            ):
+                encoded = self._encode_multi_process(to_encode)
+            else:
+                # inference_mode also skips the view and version-counter
+                # tracking that no_grad still does for every tensor in the
+                # forward pass
+                with torch.inference_mode():
+                    encoded = self.model.encode(to_encode, batch_size=32)
+            encoded = _normalize_rows(encoded)
+            for i, embedding in zip(missing, encoded):
+                embeddings[i] = embedding
+                self._remember_embedding(keys[i], embedding)
+
+        return np.stack(embeddings)
+
+    def _encode_multi_process(self, texts: List[str]) -> np.ndarray:
+        """Encode a large batch across sentence-transformers worker processes."""
+        logger.info("🧠 Encoding %d texts with a multi-process pool", len(texts))
+        pool = self.model.start_multi_process_pool()
+        try:
+            return self.model.encode_multi_process(texts, pool, batch_size=64)
+        finally:
+            self.model.stop_multi_process_pool(pool)
 
     def _find_similar_entries(
-        self, new_embedding: np.ndarray, past_entries: List[Dict], top_k: int = 5
+        self,
+        new_embedding: np.ndarray,
+        past_entries: PastEntries,
+        top_k: int = 5,
+        now: Optional[datetime] = None,
     ) -> List[Dict]:
-        """Find the most similar past entries using cosine similarity."""
+        """
+        Find the most similar past entries using cosine similarity.
+
+        Each result carries `days_ago` relative to `now`, computed from the
+        parsed timestamp column so insight templates need not re-parse it.
+        """
         if len(past_entries) == 0:
             return []
 
-        past_embeddings = np.array([entry["embedding"] for entry in past_entries])
-        similarities = cosine_similarity(new_embedding.reshape(1, -1), past_embeddings)[
-            0
-        ]
-        top_indices = np.argsort(similarities)[::-1][:top_k]
+        if now is None:
+            now = datetime.now()
+
+        # Both sides are unit-length, so cosine similarity is a single
+        # matrix-vector product against the stored embedding matrix
+        similarities = past_entries.embeddings @ new_embedding
+
+        # Linear-time selection of the top k, then sort only those k
+        k = min(top_k, len(similarities))
+        candidates = np.argpartition(-similarities, k - 1)[:k]
+        top_indices = candidates[np.argsort(-similarities[candidates])]
+        days_ago = (
+            np.datetime64(now, "us") - past_entries.times[top_indices]
+        ) // np.timedelta64(1, "D")
 
         similar = []
-        for idx in top_indices:
+        for idx, days in zip(top_indices, days_ago):
             similarity_score = float(similarities[idx])
             if similarity_score > 0.3:
                 similar.append(
                     {
-                        "text": past_entries[idx]["text"],
+                        "text": past_entries.texts[idx],
                         "similarity": similarity_score,
-                        "timestamp": past_entries[idx]["timestamp"],
-                        "mood": past_entries[idx].get("mood", 3),
+                        "timestamp": past_entries.timestamps[idx],
+                        "mood": past_entries.moods[idx],
+                        "days_ago": int(days),
                     }
                 )
         return similar
@@ -260,38 +1190,30 @@ class Analyzer:
             "interpretation": interpretation,
         }
 
-    def _detect_nuanced_sentiment(self, text: str) -> Dict:
+    def _detect_nuanced_sentiment(
+        self, text: str, text_embedding: Optional[np.ndarray] = None
+    ) -> Dict:
         """
         Detect emotional nuance beyond binary positive/negative.
 
         Why it matters: "Anxious but hopeful" is very different from "anxious and defeated".
         Captures the complexity of human emotion.
-        """
-        emotion_refs = {
-            "hopeful": [
-                "feeling hopeful",
-                "things might improve",
-                "I'm optimistic",
-                "looking forward",
-            ],
-            "defeated": ["giving up", "nothing works", "hopeless", "can't do this"],
-            "anxious": ["worried", "nervous", "anxious", "scared", "afraid"],
-            "calm": ["peaceful", "calm", "relaxed", "at ease", "tranquil"],
-            "energized": ["motivated", "energized", "excited", "driven", "inspired"],
-            "exhausted": ["tired", "drained", "exhausted", "burnt out", "depleted"],
-            "grateful": ["thankful", "grateful", "blessed", "appreciate", "fortunate"],
-            "angry": ["frustrated", "angry", "irritated", "furious", "mad"],
-            "sad": ["sad", "depressed", "down", "unhappy", "miserable"],
-            "content": ["content", "satisfied", "okay", "fine", "stable"],
-        }
-
-        text_embedding = self.model.encode(text).reshape(1, -1)
 
-        emotion_scores = {}
-        for emotion, refs in emotion_refs.items():
-            ref_embeddings = self.model.encode(refs)
-            similarity = cosine_similarity(text_embedding, ref_embeddings).mean()
-            emotion_scores[emotion] = float(similarity)
+        Pass `text_embedding` when the caller already encoded `text` to skip
+        a second transformer forward pass.
+        """
+        if text_embedding is None:
+            text_embedding = self._encode([text])[0]
+
+        # Both sides are unit-length, so one matrix-vector product gives the
+        # cosine similarity to every reference phrase; reduceat then averages
+        # each emotion's contiguous block of rows
+        similarities = self._emotion_ref_matrix @ text_embedding
+        means = (
+            np.add.reduceat(similarities, self._emotion_ref_offsets)
+            / self._emotion_ref_counts
+        )
+        emotion_scores = dict(zip(self._emotion_names, means.tolist()))
 
         # Get top 2 emotions
         top_emotions = sorted(emotion_scores.items(), key=lambda x: x[1], reverse=True)[
@@ -325,42 +1247,13 @@ class Analyzer:
         question_count = text.count("?")
 
         # Detect reflective language
-        reflective_phrases = [
-            "i wonder",
-            "i realize",
-            "i realized",
-            "i noticed",
-            "i learned",
-            "maybe",
-            "perhaps",
-            "what if",
-            "i think",
-            "i believe",
-            "i understand",
-            "i see now",
-            "looking back",
-        ]
-
         text_lower = text.lower()
         reflection_count = sum(
-            1 for phrase in reflective_phrases if phrase in text_lower
+            1 for phrase in _REFLECTIVE_PHRASES if phrase in text_lower
         )
 
         # Detect venting/stuck language
-        venting_phrases = [
-            "i hate",
-            "i can't",
-            "i cant",
-            "nothing",
-            "never works",
-            "always",
-            "why does",
-            "why do",
-            "sick of",
-            "so tired of",
-        ]
-
-        venting_count = sum(1 for phrase in venting_phrases if phrase in text_lower)
+        venting_count = sum(1 for phrase in _VENTING_PHRASES if phrase in text_lower)
 
         # Determine mode
         if reflection_count > venting_count and question_count > 0:
@@ -381,7 +1274,7 @@ class Analyzer:
         }
 
     def _analyze_theme_cooccurrence(
-        self, current_themes: List[str], past_entries: List[Dict]
+        self, current_themes: List[str], past_entries: PastEntries
     ) -> Optional[Dict]:
         """
         Find which themes appear together and what that predicts.
@@ -396,24 +1289,13 @@ class Analyzer:
         # Build co-occurrence patterns from history
         cooccurrence = defaultdict(lambda: {"count": 0, "moods": []})
 
-        for entry in past_entries:
-            entry_text = entry.get("text", "")
-            entry_mood = entry.get("mood", 3)
+        for entry_text, entry_mood in zip(past_entries.texts, past_entries.moods):
 
             # Quick theme detection for past entries (simplified)
             text_lower = entry_text.lower()
             entry_themes = []
 
-            theme_keywords = {
-                "work": ["work", "job", "meeting", "deadline", "project"],
-                "sleep": ["sleep", "tired", "exhausted", "insomnia"],
-                "anxiety": ["anxiety", "anxious", "worried", "stress"],
-                "relationships": ["relationship", "partner", "friend", "family"],
-                "exercise": ["exercise", "gym", "workout", "run"],
-                "mental_health": ["therapy", "depression", "mental"],
-            }
-
-            for theme, keywords in theme_keywords.items():
+            for theme, keywords in _COOCCURRENCE_THEME_KEYWORDS.items():
                 if any(kw in text_lower for kw in keywords):
                     entry_themes.append(theme)
 
@@ -438,7 +1320,9 @@ class Analyzer:
 
         return None
 
-    def _analyze_writing_frequency(self, past_entries: List[Dict]) -> Dict:
+    def _analyze_writing_frequency(
+        self, past_entries: PastEntries, now: Optional[datetime] = None
+    ) -> Dict:
         """
         Understand the user's journaling rhythm and recent changes.
 
@@ -449,15 +1333,12 @@ class Analyzer:
         if len(past_entries) < 2:
             return {"pattern": "new_user"}
 
-        # Calculate days between entries
-        timestamps = sorted(
-            [datetime.fromisoformat(e["timestamp"]) for e in past_entries]
-        )
-        timestamps.append(datetime.now())  # Include current entry
+        if now is None:
+            now = datetime.now()
 
-        gaps = [
-            (timestamps[i + 1] - timestamps[i]).days for i in range(len(timestamps) - 1)
-        ]
+        # Calculate whole days between entries, including the current one
+        timestamps = np.append(np.sort(past_entries.times), np.datetime64(now, "us"))
+        gaps = np.diff(timestamps) // np.timedelta64(1, "D")
 
         avg_gap = np.mean(gaps)
 
@@ -589,15 +1470,16 @@ class Analyzer:
 
     # ============== LEGACY SENTIMENT (kept for backwards compatibility) ==============
 
-    def _detect_sentiment(self, text: str) -> Dict:
+    def _detect_sentiment(
+        self, text: str, text_embedding: Optional[np.ndarray] = None
+    ) -> Dict:
         """Legacy sentiment detection - now just calls nuanced version."""
-        sentiment = self._detect_nuanced_sentiment(text)
+        sentiment = self._detect_nuanced_sentiment(text, text_embedding)
 
         # Convert to legacy format
-        positive_emotions = {"hopeful", "calm", "energized", "grateful", "content"}
         detected = (
             "positive"
-            if sentiment["primary_emotion"] in positive_emotions
+            if sentiment["primary_emotion"] in _POSITIVE_EMOTIONS
             else "negative"
         )
 
@@ -612,105 +1494,19 @@ class Analyzer:
         self, text: str, mood_rating: int, sentiment: Dict
     ) -> Dict:
         """Generate a summary label for timeline display."""
-        theme_categories = {
-            "work": [
-                "work",
-                "job",
-                "career",
-                "presentation",
-                "meeting",
-                "boss",
-                "manager",
-                "colleague",
-                "deadline",
-                "project",
-                "interview",
-                "promotion",
-                "performance",
-                "client",
-                "review",
-            ],
-            "relationships": [
-                "relationship",
-                "partner",
-                "friend",
-                "family",
-                "conflict",
-                "communication",
-                "connection",
-                "love",
-                "breakup",
-                "argument",
-                "lonely",
-                "social",
-                "dating",
-                "marriage",
-                "divorce",
-            ],
-            "mental_health": [
-                "anxiety",
-                "depression",
-                "therapy",
-                "therapist",
-                "medication",
-                "panic",
-                "stress",
-                "overwhelmed",
-                "burnout",
-                "worried",
-                "nervous",
-                "fear",
-                "anxious",
-                "scared",
-            ],
-            "physical_health": [
-                "health",
-                "sleep",
-                "exercise",
-                "gym",
-                "diet",
-                "tired",
-                "energy",
-                "pain",
-                "doctor",
-                "sick",
-                "headache",
-                "medical",
-            ],
-            "personal_growth": [
-                "growth",
-                "learning",
-                "confidence",
-                "success",
-                "achievement",
-                "progress",
-                "goal",
-                "improve",
-                "proud",
-                "accomplished",
-                "development",
-                "skills",
-            ],
-            "daily_life": [
-                "routine",
-                "habits",
-                "schedule",
-                "home",
-                "chores",
-                "errands",
-                "weekend",
-                "morning",
-                "evening",
-                "daily",
-            ],
-        }
-
         text_lower = text.lower()
-        detected_themes = []
 
-        for theme, keywords in theme_categories.items():
-            if any(keyword in text_lower for keyword in keywords):
+        found_keywords = set()
+        for match in set(_KEYWORD_PATTERN.findall(text_lower)):
+            found_keywords |= _KEYWORD_PREFIXES[match]
+
+        detected_themes = []
+        for theme, keywords in _THEME_CATEGORIES.items():
+            if not found_keywords.isdisjoint(keywords):
                 detected_themes.append(theme)
+                # Only the first three themes are kept
+                if len(detected_themes) == 3:
+                    break
 
         if not detected_themes:
             detected_themes = ["personal_reflection"]
@@ -735,62 +1531,16 @@ class Analyzer:
 
         primary_theme = detected_themes[0].replace("_", " ").title()
 
-        specific_keywords = {
-            "performance review": "Performance Review",
-            "quarterly review": "Review",
-            "presentation": "Presentation",
-            "interview": "Interview",
-            "therapy": "Therapy Session",
-            "conflict": "Conflict",
-            "meeting": "Meeting",
-            "deadline": "Deadline",
-            "project": "Project",
-        }
-
         title_subject = None
-        for keyword, label in specific_keywords.items():
-            if keyword in text_lower:
+        for keyword, label in _SPECIFIC_KEYWORDS.items():
+            if keyword in found_keywords:
                 title_subject = label
                 break
 
         if not title_subject:
-            exclude_words = {
-                "I",
-                "The",
-                "A",
-                "And",
-                "But",
-                "So",
-                "Or",
-                "My",
-                "This",
-                "That",
-                "These",
-                "Those",
-                "It",
-                "They",
-                "We",
-                "He",
-                "She",
-                "Had",
-                "Was",
-                "Were",
-                "Been",
-                "Have",
-                "Has",
-                "Did",
-                "Do",
-            }
-
-            words = text.split()
-            specific_topics = [
-                w.strip(".,!?")
-                for w in words
-                if w and w[0].isupper() and len(w) > 2 and w not in exclude_words
-            ]
-
-            if specific_topics:
-                title_subject = specific_topics[0]
+            proper_noun = _PROPER_NOUN_PATTERN.search(text)
+            if proper_noun:
+                title_subject = proper_noun.group()
 
         if title_subject:
             title = f"{primary_theme} - {title_subject}"
@@ -816,19 +1566,24 @@ class Analyzer:
         reflection: Dict,
         theme_context: Optional[Dict],
         frequency_pattern: Optional[Dict],
-        all_past_entries: List[Dict],
+        all_past_entries: PastEntries,
+        new_embedding: Optional[np.ndarray] = None,
     ) -> str:
         """
         Generate deeply personalized insights.
         Routes to LLM-based RAG pipeline or template-based fallback.
         """
         
-        # Route to LLM if available
-        if self.use_llm:
+        # Route to LLM if available. When there is history but nothing in it
+        # is similar, the prompt has no retrieved context to work from, so
+        # the template's sparse-pattern insight is used instead of a
+        # multi-second generation.
+        no_context = len(all_past_entries) > 0 and not similar_entries
+        if self.use_llm and not no_context:
             return self._generate_llm_insight(
                 new_entry_text, similar_entries, mood_rating, mental_state,
                 writing_intensity, sentiment, reflection, theme_context,
-                frequency_pattern, all_past_entries
+                frequency_pattern, all_past_entries, new_embedding
             )
         else:
             # Fallback to template-based insights
@@ -849,7 +1604,8 @@ class Analyzer:
         reflection: Dict,
         theme_context: Optional[Dict],
         frequency_pattern: Optional[Dict],
-        all_past_entries: List[Dict],
+        all_past_entries: PastEntries,
+        new_embedding: Optional[np.ndarray] = None,
     ) -> str:
         """
         Generate insight using RAG LLM pipeline.
@@ -858,9 +1614,12 @@ class Analyzer:
         1. RETRIEVE: Use embeddings to find similar past entries (already done)
         2. AUGMENT: Build context-rich prompt with retrieved entries
         3. GENERATE: Use LLM to create personalized insight
+
+        Generated insights are cached: an identical prompt, or a near-duplicate
+        entry (`new_embedding`) with the same mood rating, skips generation.
         """
         
-        if not self.use_llm or self.llm is None:
+        if not self.use_llm:
             # Fallback to template-based insights
             return self._generate_insight_template(
                 new_entry_text, similar_entries, mood_rating, mental_state,
@@ -881,11 +1640,33 @@ class Analyzer:
             frequency_pattern=frequency_pattern,
             entry_count=len(all_past_entries),
         )
+
+        prompt_key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+        cached = self._insight_cache.get(prompt_key)
+        # The history size and retrieved entries the insight is built from
+        context = (
+            len(all_past_entries),
+            tuple(entry["text"] for entry in similar_entries),
+        )
+        if cached is not None:
+            self._insight_cache.move_to_end(prompt_key)
+        elif new_embedding is not None:
+            cached = self._find_semantic_insight(new_embedding, mood_rating, context)
+        if cached is not None:
+            logger.debug("♻️  Reusing cached LLM insight")
+            return cached
+
+        self._ensure_llm_loaded()
+        if self.llm is None:
+            return self._generate_insight_template(
+                new_entry_text, similar_entries, mood_rating, mental_state,
+                writing_intensity, sentiment, reflection, theme_context,
+                frequency_pattern, all_past_entries
+            )
         
         # Generate insight using LLM
         try:
-            sys.stderr.write("🤖 Generating LLM insight...\n")
-            sys.stderr.flush()
+            logger.debug("🤖 Generating LLM insight...")
             
             response = self.llm(
                 prompt,
@@ -898,15 +1679,16 @@ class Analyzer:
             
             insight = response["choices"][0]["text"].strip()
             
-            sys.stderr.write(f"✅ LLM insight generated ({len(insight)} chars)\n")
-            sys.stderr.flush()
-            
+            logger.debug("✅ LLM insight generated (%d chars)", len(insight))
+
+            self._remember_insight(
+                prompt_key, new_embedding, mood_rating, context, insight
+            )
             return insight
             
         except Exception as e:
-            sys.stderr.write(f"⚠️  LLM generation failed: {e}\n")
-            sys.stderr.write("⚠️  Falling back to template-based insight.\n")
-            sys.stderr.flush()
+            logger.warning("⚠️  LLM generation failed: %s", e)
+            logger.warning("⚠️  Falling back to template-based insight.")
             
             # Fallback to templates
             return self._generate_insight_template(
@@ -915,6 +1697,50 @@ class Analyzer:
                 frequency_pattern, all_past_entries
             )
 
+    def _find_semantic_insight(
+        self, new_embedding: np.ndarray, mood_rating: int, context: Tuple
+    ) -> Optional[str]:
+        """
+        Return the insight of a recent near-duplicate entry, if any.
+
+        `context` is the (history size, retrieved entry texts) the insight
+        would be built from; insights built from other context cite entries
+        that no longer match, so they are not reused.
+        """
+        candidates = [
+            (embedding, insight)
+            for embedding, mood, insight_context, insight in self._semantic_insights
+            if mood == mood_rating and insight_context == context
+        ]
+        if not candidates:
+            return None
+
+        # Stored embeddings are unit-length, so this is cosine similarity
+        similarities = np.stack([emb for emb, _ in candidates]) @ new_embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] > SEMANTIC_INSIGHT_THRESHOLD:
+            return candidates[best][1]
+        return None
+
+    def _remember_insight(
+        self,
+        prompt_key: str,
+        new_embedding: Optional[np.ndarray],
+        mood_rating: int,
+        context: Tuple,
+        insight: str,
+    ):
+        """Add a generated insight to the exact and semantic caches."""
+        self._insight_cache[prompt_key] = insight
+        self._insight_cache.move_to_end(prompt_key)
+        if len(self._insight_cache) > INSIGHT_CACHE_SIZE:
+            self._insight_cache.popitem(last=False)
+
+        if new_embedding is not None:
+            self._semantic_insights.append(
+                (new_embedding, mood_rating, context, insight)
+            )
+
     def _build_rag_prompt(
         self,
         new_entry_text: str,
@@ -941,7 +1767,7 @@ class Analyzer:
         context_entries = []
         if similar_entries:
             for i, entry in enumerate(similar_entries[:3], 1):
-                time_ago = self._format_time_ago(entry["timestamp"])
+                time_ago = self._format_time_ago(entry)
                 context_entries.append(
                     f"Past Entry #{i} ({time_ago}, mood: {entry.get('mood', 3)}/5, "
                     f"{int(entry['similarity']*100)}% similar):\n\"{entry['text'][:200]}...\""
@@ -984,9 +1810,10 @@ Current Analysis:
         
         special_insights = "\n- ".join(insights_to_mention) if insights_to_mention else "None"
         
-        # Build the full prompt
-        prompt = f"""You are a compassionate journaling companion helping someone process their emotions. You have access to their current journal entry and past similar entries.
-
+        # The invariant instructions come first so llama.cpp can reuse their
+        # KV cache from the previous call and only prefill the entry-specific
+        # context below
+        prompt = _RAG_PROMPT_PREFIX + f"""
 ## Retrieved Past Entries (Most Similar):
 {context_block}
 
@@ -998,29 +1825,8 @@ Current Analysis:
 ## Special Insights to Consider:
 - {special_insights}
 
-TASK:
-Analyze connections between the current entry and past entries. Identify:
-
-1. **Recurring Themes**: Topics, concerns, or situations that appear across entries
-2. **Behavioral Patterns**: Repeated actions, reactions, or coping mechanisms
-3. **Emotional Trajectories**: How feelings about similar situations have evolved
-4. **Cognitive Patterns**: Thought processes, decision-making styles, or mental frameworks
-5. **Progress Indicators**: Growth, stagnation, or regression in specific areas
-6. **Blind Spots**: Patterns the writer may not be aware of
-
-GUIDELINES:
-- Be specific, citing dates and examples
-- Note both positive patterns and areas for reflection
-- Avoid being judgmental; focus on observation
-- Highlight growth and positive changes
-- Ask thought-provoking questions when appropriate
-- Keep insights actionable
-
-Talk to the person Provide 3-5 key insights, prioritizing the most meaningful patterns. Do not make insights up if there are no past similar entries.
-
-Be conversational, empathetic, and specific to their experiences. Avoid generic advice.
-
-In the first paragraph, state all of the context you were given. In the second paragraph, tell the user the patterns you have found."""
+## Your Response:
+"""
 
         return prompt
 
@@ -1035,7 +1841,7 @@ In the first paragraph, state all of the context you were given. In the second p
         reflection: Dict,
         theme_context: Optional[Dict],
         frequency_pattern: Optional[Dict],
-        all_past_entries: List[Dict],
+        all_past_entries: PastEntries,
     ) -> str:
         """
         Generate deeply personalized insights using template-based logic.
@@ -1106,7 +1912,7 @@ In the first paragraph, state all of the context you were given. In the second p
         )
 
     def _analyze_patterns(
-        self, similar_entries: List[Dict], all_entries: List[Dict]
+        self, similar_entries: List[Dict], all_entries: PastEntries
     ) -> Dict:
         """Detect patterns across multiple entries for personalization."""
 
@@ -1132,7 +1938,7 @@ In the first paragraph, state all of the context you were given. In the second p
                 has_decline = True
 
         # Extract user's personal phrases
-        user_phrases = self._extract_key_phrases(all_entries)
+        user_phrases = self._extract_key_phrases(all_entries.texts)
 
         # Find action patterns in past entries
         actions_taken = self._extract_actions(similar_entries)
@@ -1151,13 +1957,13 @@ In the first paragraph, state all of the context you were given. In the second p
         }
 
     def _extract_key_phrases(
-        self, entries: List[Dict], min_count: int = 2
+        self, texts: List[str], min_count: int = 2
     ) -> List[str]:
         """Extract frequently used 2-3 word phrases from user's entries."""
-        if len(entries) < 3:
+        if len(texts) < 3:
             return []
 
-        all_text = " ".join([e["text"].lower() for e in entries])
+        all_text = " ".join(texts).lower()
         words = re.findall(r"\b\w+\b", all_text)
 
         # Extract bigrams and trigrams
@@ -1173,31 +1979,11 @@ In the first paragraph, state all of the context you were given. In the second p
         phrase_counts = Counter(phrases)
 
         # Filter out generic phrases
-        generic_stopwords = {
-            "i feel",
-            "i am",
-            "i was",
-            "i have",
-            "i want",
-            "i think",
-            "i need",
-            "i can",
-            "i will",
-            "i would",
-            "i should",
-            "it is",
-            "it was",
-            "to be",
-            "in the",
-            "of the",
-            "and i",
-        }
-
         meaningful_phrases = [
             phrase
             for phrase, count in phrase_counts.items()
             if count >= min_count
-            and phrase not in generic_stopwords
+            and phrase not in _GENERIC_PHRASES
             and len(phrase) > 5
         ]
 
@@ -1207,20 +1993,10 @@ In the first paragraph, state all of the context you were given. In the second p
         """Extract action-oriented phrases (what user did in past to cope/improve)."""
         actions = []
 
-        action_patterns = [
-            r"talked to (\w+)",
-            r"went for a (\w+)",
-            r"decided to ([\w\s]{3,20})",
-            r"started ([\w\s]{3,20})",
-            r"tried ([\w\s]{3,20})",
-            r"called (\w+)",
-            r"reached out to (\w+)",
-        ]
-
         for entry in entries:
             text = entry["text"].lower()
-            for pattern in action_patterns:
-                matches = re.findall(pattern, text)
+            for pattern in _ACTION_PATTERNS:
+                matches = pattern.findall(text)
                 for match in matches:
                     action = match.strip()
                     if len(action) > 2:
@@ -1232,95 +2008,21 @@ In the first paragraph, state all of the context you were given. In the second p
         self, text: str, prioritize_actions: bool = False
     ) -> str:
         """Extract the most meaningful sentence(s) from a past entry."""
-        sentences = [s.strip() for s in text.split(".") if s.strip()]
-
-        if len(sentences) == 0:
-            return text[:200]
-
-        # Score sentences by meaningfulness
-        scored_sentences = []
-
-        action_keywords = [
-            "decided",
-            "tried",
-            "started",
-            "realized",
-            "learned",
-            "talked",
-            "called",
-            "went",
-            "made",
-            "chose",
-        ]
-        emotion_keywords = [
-            "feel",
-            "felt",
-            "feeling",
-            "emotion",
-            "mood",
-            "happy",
-            "sad",
-            "anxious",
-            "relieved",
-            "grateful",
-        ]
-
-        for sent in sentences:
-            score = 0
-            sent_lower = sent.lower()
-            word_count = len(sent.split())
-
-            # Prioritize action sentences
-            if any(word in sent_lower for word in action_keywords):
-                score += 4
-
-            # Value emotional content
-            if any(word in sent_lower for word in emotion_keywords):
-                score += 2
-
-            # Prefer substantial sentences (not too short, not too long)
-            if 8 <= word_count <= 20:
-                score += 2
-            elif word_count > 20:
-                score += 1
+        return _meaningful_quote(text)
 
-            scored_sentences.append((score, sent))
+    def _format_time_ago(self, entry: Dict, now: Optional[datetime] = None) -> str:
+        """
+        Format an entry's age as a human-readable 'time ago' string.
 
-        # Sort by score and take best 1-2 sentences
-        scored_sentences.sort(reverse=True, key=lambda x: x[0])
+        Uses the `days_ago` precomputed by `_find_similar_entries` when
+        present and only parses `timestamp` otherwise.
+        """
+        days_ago = entry.get("days_ago")
+        if days_ago is None:
+            ts = datetime.fromisoformat(entry["timestamp"])
+            days_ago = ((now or datetime.now()) - ts).days
 
-        if len(scored_sentences) >= 2 and scored_sentences[0][0] > 0:
-            best = [scored_sentences[0][1], scored_sentences[1][1]]
-            quote = ". ".join(best) + "."
-        else:
-            quote = scored_sentences[0][1] + "."
-
-        # Truncate if too long
-        if len(quote) > 200:
-            quote = quote[:197] + "..."
-
-        return quote
-
-    def _format_time_ago(self, timestamp: str) -> str:
-        """Format timestamp as human-readable 'time ago' string."""
-        ts = datetime.fromisoformat(timestamp)
-        days_ago = (datetime.now() - ts).days
-
-        if days_ago == 0:
-            return "earlier today"
-        elif days_ago == 1:
-            return "yesterday"
-        elif days_ago < 7:
-            return f"{days_ago} days ago"
-        elif days_ago < 30:
-            weeks = days_ago // 7
-            return f"{weeks} week{'s' if weeks > 1 else ''} ago"
-        elif days_ago < 365:
-            months = days_ago // 30
-            return f"{months} month{'s' if months > 1 else ''} ago"
-        else:
-            years = days_ago // 365
-            return f"{years} year{'s' if years > 1 else ''} ago"
+        return _days_ago_to_phrase(days_ago)
 
     # ============== NEW: COMPOSITE SCORE INSIGHT METHODS ==============
 
@@ -1347,7 +2049,7 @@ In the first paragraph, state all of the context you were given. In the second p
         context = ""
         if len(similar_entries) > 0:
             most_similar = similar_entries[0]
-            time_ago = self._format_time_ago(most_similar["timestamp"])
+            time_ago = self._format_time_ago(most_similar)
             context = f" {time_ago.capitalize()}, you felt similarly."
 
         if diff >= 0.7:
@@ -1443,7 +2145,7 @@ In the first paragraph, state all of the context you were given. In the second p
         typical_mood = theme_context["typical_mood"]
 
         most_similar = similar_entries[0]
-        time_ago = self._format_time_ago(most_similar["timestamp"])
+        time_ago = self._format_time_ago(most_similar)
         quote = self._extract_meaningful_quote(most_similar["text"])
 
         composite = mental_state["composite_score"]
@@ -1491,8 +2193,8 @@ In the first paragraph, state all of the context you were given. In the second p
         earliest = sorted_entries[0]
         latest = sorted_entries[-1]
 
-        earliest_time = self._format_time_ago(earliest["timestamp"])
-        latest_time = self._format_time_ago(latest["timestamp"])
+        earliest_time = self._format_time_ago(earliest)
+        latest_time = self._format_time_ago(latest)
 
         earliest_mood = earliest.get("mood", 3)
         latest_mood = latest.get("mood", 3)
@@ -1554,7 +2256,7 @@ In the first paragraph, state all of the context you were given. In the second p
 
         weekday, count = patterns["temporal_pattern"]
         most_similar = similar_entries[0]
-        time_ago = self._format_time_ago(most_similar["timestamp"])
+        time_ago = self._format_time_ago(most_similar)
         composite = mental_state["composite_score"]
 
         quote = self._extract_meaningful_quote(most_similar["text"])
@@ -1582,7 +2284,7 @@ In the first paragraph, state all of the context you were given. In the second p
         """Enhanced single-entry comparison with added context."""
 
         most_similar = similar_entries[0]
-        time_ago = self._format_time_ago(most_similar["timestamp"])
+        time_ago = self._format_time_ago(most_similar)
         past_mood = most_similar.get("mood", 3)
         composite = mental_state["composite_score"]
 
@@ -1697,7 +2399,7 @@ In the first paragraph, state all of the context you were given. In the second p
 
         if len(similar_entries) == 1:
             most_similar = similar_entries[0]
-            time_ago = self._format_time_ago(most_similar["timestamp"])
+            time_ago = self._format_time_ago(most_similar)
 
             return (
                 f"This reminds me of something you wrote {time_ago}. "
@@ -1719,3 +2421,14 @@ In the first paragraph, state all of the context you were given. In the second p
                     f"and {writing_intensity['interpretation']}. "
                     f"As you continue, connections to past experiences may reveal themselves."
                 )
+
+
+@lru_cache(maxsize=2)
+def get_analyzer(use_llm: bool = False) -> Analyzer:
+    """
+    Return the process-wide Analyzer for `use_llm`, building it on first use.
+
+    Loading the embedding model takes seconds, so scripts and tests that ask
+    for an analyzer more than once share a single instance.
+    """
+    return Analyzer(use_llm=use_llm)
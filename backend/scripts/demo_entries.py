@@ -0,0 +1,185 @@
+"""
+Demo journal entries and their precomputed analyses.
+
+The entries themselves live in demo_entries.jsonl. They are fixed demo
+content, so their embeddings and analyses never change between runs.
+generate_demo_cache.py runs the analyzer over them once and writes
+demo_entries_precomputed.json next to this file. The file is generated
+locally, not shipped: when it is present and up to date load_demo_data.py
+reads it instead of loading the ML models, and otherwise it falls back to
+analyze_demo_entries().
+"""
+
+import base64
+import hashlib
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from backend.database import json_loads
+
+logger = logging.getLogger(__name__)
+
+# Entries whose embeddings are closer than this to an earlier entry are
+# dropped: near-duplicates only crowd each other out of similarity results
+DUPLICATE_SIMILARITY = 0.95
+
+DEMO_ENTRIES_PATH = Path(__file__).resolve().with_name("demo_entries.jsonl")
+PRECOMPUTED_PATH = Path(__file__).resolve().with_name("demo_entries_precomputed.json")
+
+# Analysis fields stored with each demo entry. The app only reads the summary
+# back for past entries, so that is all demo rows carry; the insight,
+# similar-entry search and other components behind it are skipped.
+DEMO_ANALYSIS_FEATURES = ("summary",)
+
+
+def _read_demo_entries(path=DEMO_ENTRIES_PATH):
+    """Read demo entries (content, mood, days_ago) from a JSONL file."""
+    with open(path, "rb") as f:
+        return [json_loads(line) for line in f if line.strip()]
+
+
+# Demo entries designed to show clear patterns
+demo_entries = _read_demo_entries()
+
+
+def demo_entries_hash(entries=demo_entries):
+    """Fingerprint of the demo content, used to spot a stale precomputed file."""
+    payload = json.dumps(
+        [[e["content"], e["mood"], e["days_ago"]] for e in entries]
+    ).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def backdated_timestamps(days_ago, now=None):
+    """
+    ISO timestamps for entries written `days_ago` days before `now`.
+
+    One datetime64 subtraction over the whole list instead of a timedelta
+    per entry.
+    """
+    if now is None:
+        now = datetime.now()
+    days = np.fromiter(days_ago, dtype=np.int64).astype("timedelta64[D]")
+    times = np.datetime64(now, "us") - days
+    return np.datetime_as_string(times, unit="us").tolist()
+
+
+def near_duplicate_mask(embeddings, threshold=DUPLICATE_SIMILARITY):
+    """
+    Boolean mask keeping each row unless it is a near-duplicate of an
+    earlier kept row (cosine similarity above `threshold`).
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    unit = embeddings / np.maximum(norms, 1e-12)
+
+    # One GEMM for every pairwise similarity; only earlier rows count
+    similarity = np.tril(unit @ unit.T, k=-1)
+
+    keep = np.ones(len(unit), dtype=bool)
+    for i in range(1, len(unit)):
+        if (similarity[i, :i][keep[:i]] > threshold).any():
+            keep[i] = False
+    return keep
+
+
+def analyze_demo_entries(analyzer, entries=demo_entries):
+    """
+    Run the analyzer over the demo entries, oldest first.
+
+    Near-duplicates of an earlier entry are skipped. Only the
+    DEMO_ANALYSIS_FEATURES are computed, none of which look at other
+    entries, so the entries are not compared against each other. Returns
+    one record per kept entry: content, mood, days_ago, embedding and the
+    analysis fields that are stored with the entry.
+    """
+    # Embed every demo entry up front in one batched model call
+    embeddings = analyzer.embed_batch([entry["content"] for entry in entries])
+
+    keep = near_duplicate_mask(embeddings)
+    if not keep.all():
+        logger.info(
+            "Dropping %d near-duplicate demo entries: %s",
+            int((~keep).sum()),
+            np.flatnonzero(~keep).tolist(),
+        )
+        entries = [entry for entry, kept in zip(entries, keep) if kept]
+        embeddings = embeddings[keep]
+
+    # Reuse the embeddings computed above instead of encoding the texts again
+    analyses = analyzer.analyze_batch(
+        [{"text": entry["content"], "mood": entry["mood"]} for entry in entries],
+        features=DEMO_ANALYSIS_FEATURES,
+        embeddings=embeddings,
+    )
+
+    records = []
+    for entry, analysis in zip(entries, analyses):
+        records.append(
+            {
+                "content": entry["content"],
+                "mood": entry["mood"],
+                "days_ago": entry["days_ago"],
+                "embedding": analysis["embedding"],
+                # Analysis for storage (embedding is stored separately)
+                "analysis": {
+                    feature: analysis[feature] for feature in DEMO_ANALYSIS_FEATURES
+                },
+            }
+        )
+
+    return records
+
+
+def save_precomputed(records, path=PRECOMPUTED_PATH):
+    """Write analyzed demo records to `path` as JSON (embeddings as base64 fp16)."""
+    payload = {
+        "source_hash": demo_entries_hash(),
+        "entries": [
+            {
+                "content": r["content"],
+                "mood": r["mood"],
+                "days_ago": r["days_ago"],
+                "embedding_b64": base64.b64encode(
+                    np.asarray(r["embedding"], dtype=np.float16).tobytes()
+                ).decode("ascii"),
+                "analysis": r["analysis"],
+            }
+            for r in records
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+
+
+def load_precomputed(path=PRECOMPUTED_PATH):
+    """
+    Read precomputed demo records, or return None if the file is missing or
+    was generated from different demo content.
+    """
+    try:
+        with open(path, "rb") as f:
+            payload = json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if payload.get("source_hash") != demo_entries_hash():
+        return None
+
+    return [
+        {
+            "content": r["content"],
+            "mood": r["mood"],
+            "days_ago": r["days_ago"],
+            # Left as float16; the database quantizes it when the row is saved
+            "embedding": np.frombuffer(
+                base64.b64decode(r["embedding_b64"]), dtype=np.float16
+            ),
+            "analysis": r["analysis"],
+        }
+        for r in payload["entries"]
+    ]
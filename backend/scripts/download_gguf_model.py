@@ -5,33 +5,19 @@ Much smaller and faster than the full transformers model.
 
 import os
 import sys
-import requests
-from tqdm import tqdm
-
-def download_file(url, destination):
-    """Download file with progress bar."""
-    response = requests.get(url, stream=True)
-    total_size = int(response.headers.get('content-length', 0))
-    
-    os.makedirs(os.path.dirname(destination), exist_ok=True)
-    
-    with open(destination, 'wb') as f, tqdm(
-        desc=os.path.basename(destination),
-        total=total_size,
-        unit='iB',
-        unit_scale=True,
-        unit_divisor=1024,
-    ) as pbar:
-        for data in response.iter_content(chunk_size=1024):
-            size = f.write(data)
-            pbar.update(size)
+from huggingface_hub import hf_hub_download, hf_hub_url
 
 def download_gemma_gguf():
     """Download Gemma-2B GGUF model from Hugging Face."""
     
     script_dir = os.path.dirname(os.path.abspath(__file__))
     models_dir = os.path.join(script_dir, "models")
-    model_file = os.path.join(models_dir, "gemma-2b-Q4_K_M.gguf")
+
+    # Hugging Face repo for the GGUF model
+    # Note: Replace with actual repo if different
+    model_repo = "bartowski/gemma-2-2b-it-GGUF"
+    model_filename = "gemma-2-2b-it-Q4_K_M.gguf"
+    model_file = os.path.join(models_dir, model_filename)
     
     print("=" * 60)
     print("📦 Downloading Gemma-2B GGUF Model (Quantized)")
@@ -50,17 +36,18 @@ def download_gemma_gguf():
             print("✅ Using existing model. Exiting.")
             return
     
-    # Hugging Face URL for GGUF model
-    # Note: Replace with actual repo if different
-    model_repo = "bartowski/gemma-2-2b-it-GGUF"
-    model_filename = "gemma-2-2b-it-Q4_K_M.gguf"
-    url = f"https://huggingface.co/{model_repo}/resolve/main/{model_filename}"
-    
     try:
-        print(f"\n📥 Downloading from: {model_repo}")
-        print(f"🔗 URL: {url}\n")
+        print(f"\n📥 Downloading from: {model_repo}\n")
         
-        download_file(url, model_file)
+        # hf_hub_download resumes interrupted transfers with range requests
+        # and verifies the file. It is saved under its Hugging Face filename,
+        # which is the name the analyzer loads, so the metadata hf_hub keeps
+        # in models_dir/.cache stays valid and a rerun finds the file.
+        hf_hub_download(
+            repo_id=model_repo,
+            filename=model_filename,
+            local_dir=models_dir,
+        )
         
         size_mb = os.path.getsize(model_file) / (1024 * 1024)
         
@@ -78,7 +65,7 @@ def download_gemma_gguf():
         print("1. Check your internet connection")
         print("2. Verify the Hugging Face repo exists")
         print("3. Try downloading manually from:")
-        print(f"   {url}")
+        print(f"   {hf_hub_url(model_repo, model_filename)}")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,42 @@
+"""
+Precompute analyses for the demo entries.
+
+Runs the ML analyzer over the fixed demo entries once and writes the
+embeddings and analyses to demo_entries_precomputed.json, so later runs of
+load_demo_data.py can seed the database without loading any models. The file
+is not checked in; run this once locally, and again after editing
+demo_entries.jsonl or changing the embedding model.
+"""
+
+from backend.log_config import configure_logging
+from backend.scripts.demo_entries import (
+    PRECOMPUTED_PATH,
+    analyze_demo_entries,
+    demo_entries,
+    save_precomputed,
+)
+
+
+def generate_demo_cache():
+    """Analyze the demo entries and write the precomputed JSON file."""
+    from backend.ml.analyzer import get_analyzer
+
+    print("🔄 Loading ML analyzer...")
+    # Template-based insights are fine for demo data
+    analyzer = get_analyzer(use_llm=False)
+    print("✅ ML analyzer loaded\n")
+
+    print(f"🧠 Analyzing {len(demo_entries)} demo entries...")
+    records = analyze_demo_entries(analyzer)
+
+    save_precomputed(records)
+    print(f"✅ Wrote {len(records)} precomputed entries to {PRECOMPUTED_PATH}")
+
+
+def main():
+    configure_logging()
+    generate_demo_cache()
+
+
+if __name__ == "__main__":
+    main()